@@ -17,16 +17,32 @@ Environment Variables Required:
 - FLASK_ENV: development or production
 - SECRET_KEY: Flask secret key
 - DATABASE_URL: SQLite database URL
+
+Optional Environment Variables:
+- SCHEDULER_MODEL: OpenAI model used for AI features (default: gpt-4o-mini)
+- SCHEDULER_TEMPERATURE: Sampling temperature; 0 gives repeatable output (default: 0.7)
 """
 
 import os
 import json
-from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_from_directory, url_for
-from flask_cors import CORS, cross_origin
+import hashlib
+import threading
+import sqlite3
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context, url_for
+from flask.json.provider import DefaultJSONProvider
+import orjson
+from flask_cors import CORS
+from flask_compress import Compress
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from models import db, Project, Task, Calendar, StatusUpdate
+from flask_migrate import Migrate, stamp
+from sqlalchemy import case, delete, event, func, inspect, insert, or_, select, update
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import joinedload, selectinload
+from models import db, Project, Task, Calendar, StatusUpdate, SyncMeta, task_dependencies, calendar_event_dict, get_priority_label, TASK_PROGRESS, MST
 import openai
 from dotenv import load_dotenv
 import pytz
@@ -34,21 +50,50 @@ import logging
 from openai import OpenAI
 from collections import defaultdict
 from dateutil import tz
+from cachetools import TTLCache
 
 # Load environment variables
 load_dotenv()
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize jsonify() responses with orjson instead of the stdlib json module"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=self.default).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE, default=self.default)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 # Initialize Flask application
 app = Flask(__name__, static_url_path='', static_folder='static')
+app.json = ORJSONProvider(app)
 
 # Configure database
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///smart_scheduler.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_pre_ping': True}
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() != 'sqlite':
+    # Server databases get a larger pool; SQLite keeps SQLAlchemy's defaults since
+    # it allows one writer at a time and its connections never go stale
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update({'pool_size': 20, 'max_overflow': 40, 'pool_recycle': 1800})
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Let SQLite readers run alongside a writer and commit without a full fsync"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')  # sorts and temp tables stay off disk
+        cursor.close()
+
 # Initialize extensions
 db.init_app(app)
 migrate = Migrate(app, db)
+Compress(app)  # gzip/brotli JSON, HTML, CSS and JS responses
 
 # Enable CORS
 CORS(app, resources={
@@ -62,107 +107,161 @@ CORS(app, resources={
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+# UTC timezone for task timestamps; MST comes from models
+UTC = pytz.UTC
+
+# Initialize OpenAI client. It is created once and reused so requests share its
+# keep-alive connection pool; the timeout keeps a stalled call from holding a
+# worker thread past gunicorn's own timeout.
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', '60'))
+client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), timeout=OPENAI_TIMEOUT)
+
+# Model settings for AI features
+SCHEDULER_MODEL = os.getenv('SCHEDULER_MODEL', 'gpt-4o-mini')
+SCHEDULER_TEMPERATURE = float(os.getenv('SCHEDULER_TEMPERATURE', '0.7'))
+
+# Prompt text for AI features. The fixed instructions come first and the
+# task/project data is appended last, so every request shares the same prefix
+# and OpenAI's automatic prompt caching can reuse it.
+TASK_ANALYSIS_SYSTEM_PROMPT = "You are a project management assistant analyzing task dependencies and providing insights."
+
+TASK_ANALYSIS_INSTRUCTIONS = """Analyze the tasks and their dependencies listed below.
+
+Please provide a concise analysis focusing on:
+1. Critical path tasks that need immediate attention
+2. Potential bottlenecks in task dependencies
+3. Scheduling recommendations based on priorities and dependencies
+4. Any risks or issues that need attention
+
+Keep the analysis practical and actionable."""
+
+STATUS_REPORT_SYSTEM_PROMPT = """You are an AI project management assistant that creates clear and concise status reports.
+Your goal is to analyze project data and create a well-structured status report that highlights:
+1. Overall project health and progress
+2. Key metrics and completion rates
+3. Important status updates and potential blockers
+4. Recommendations for next steps"""
+
+STATUS_REPORT_INSTRUCTIONS = """Create a detailed status report based on the project data below.
+Each project lists its task metrics and its most recently updated tasks.
+
+Format the report with these sections:
+1. Executive Summary
+2. Project-by-Project Breakdown
+3. Key Metrics & Progress
+4. Recent Updates & Status Changes
+5. Recommendations
+
+Use markdown formatting for better readability."""
+
+# Number of most recently updated tasks per project sent with the status report prompt
+STATUS_REPORT_RECENT_TASKS = 5
+
+# Full user prompts with the serialized data filled in via %-formatting
+TASK_ANALYSIS_PROMPT = TASK_ANALYSIS_INSTRUCTIONS + "\n\nTasks:\n%s"
+STATUS_REPORT_PROMPT = STATUS_REPORT_INSTRUCTIONS + "\n\nProject data:\n%s"
+
+# Fixed fragments of the scheduling reason shown with each suggestion
+PRIORITY_REASONS = {3: "High priority task", 2: "Medium priority task"}
+STATUS_REASONS = {
+    'Not Started': "Task hasn't been started yet",
+    'In Progress': "Task is already in progress"
+}
 
 if not os.getenv('OPENAI_API_KEY'):
     print("Warning: OPENAI_API_KEY not set. AI features will not work.")
 
-def is_working_hours(dt):
-    """Check if a datetime is within working hours (7 AM to 4 PM MST) on weekdays"""
-    # Convert to MST if not already
-    mst = pytz.timezone('America/Denver')
-    if dt.tzinfo is None:
-        dt = mst.localize(dt)
-    elif dt.tzinfo != mst:
-        dt = dt.astimezone(mst)
+# Cache of AI responses keyed by a hash of the prompt. The prompts embed the
+# task/project data they describe, so any change to that data yields a new key.
+ai_response_cache = TTLCache(maxsize=512, ttl=6 * 60 * 60)
+ai_response_cache_lock = threading.Lock()
+
+def get_ai_cache_key(*parts):
+    """Hash the model and prompt text sent to OpenAI into a cache key"""
+    return hashlib.blake2b('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+def get_cached_ai_response(key):
+    with ai_response_cache_lock:
+        return ai_response_cache.get(key)
+
+def set_cached_ai_response(key, content):
+    with ai_response_cache_lock:
+        ai_response_cache[key] = content
+
+def next_working_time(dt):
+    """Earliest time at or after dt on a weekday between 7 AM and 5 PM MST"""
+    local = dt.astimezone(MST)
+    day = local.date()
+    if local.hour >= 17:
+        day += timedelta(days=1)
+    elif local.hour >= 7 and day.weekday() < 5:
+        return local
     
-    # Check if it's a weekday (Monday = 0, Sunday = 6)
-    if dt.weekday() >= 5:  # Saturday or Sunday
-        return False
-    
-    # Check if it's between 7 AM and 4 PM MST
-    return 7 <= dt.hour < 16
-
-def generate_schedule_suggestions(tasks, calendar_events):
+    # Skip weekends in one step (Saturday +2, Sunday +1)
+    if day.weekday() >= 5:
+        day += timedelta(days=7 - day.weekday())
+    # Localize the new day's 7 AM so its UTC offset is right across DST changes
+    return MST.localize(datetime.combine(day, time(7, 0)))
+
+def generate_schedule_suggestions(tasks, calendar_events, now=None):
+    return list(iter_schedule_suggestions(tasks, calendar_events, now))
+
+def iter_schedule_suggestions(tasks, calendar_events, now=None):
+    """
+    Yield (task, suggested_time) pairs as each task's slot is found.
+    tasks must already exclude completed ones (callers filter in SQL).
+    now is the MST-aware time to start scheduling from; it defaults to the current time.
+    """
     app.logger.debug(f'Generating suggestions for {len(tasks)} tasks')
     
     # Convert all times to MST for consistent scheduling
-    mst = pytz.timezone('America/Denver')
-    current_time = datetime.now(pytz.UTC)
-    current_mst = current_time.astimezone(mst)
-    
-    # Initialize next available slot time
-    slot_time = current_mst
+    slot_time = (now or datetime.now(MST)).astimezone(MST)
     
-    # If current time is after work hours, start tomorrow
-    if slot_time.hour >= 17:  # After 5 PM
-        slot_time = (slot_time + timedelta(days=1)).replace(hour=7, minute=0)
-    elif slot_time.hour < 7:  # Before 7 AM
-        slot_time = slot_time.replace(hour=7, minute=0)
-    
-    # Convert calendar events to MST and sort by start time
-    existing_events = []
-    for event in calendar_events:
-        start = event.start_time.astimezone(mst) if event.start_time.tzinfo else mst.localize(event.start_time)
-        end = event.end_time.astimezone(mst) if event.end_time.tzinfo else mst.localize(event.end_time)
-        existing_events.append({'start': start, 'end': end})
-    existing_events.sort(key=lambda x: x['start'])
+    # Merge calendar events (loaded as MST-aware times) into sorted, non-overlapping
+    # busy intervals so the first conflict for a slot can be found by bisection
+    existing_events = [(event.start_time, event.end_time) for event in calendar_events]
+    # Callers usually pass events ordered by start_time, in which case this sort is
+    # a linear pass; it stays as a guard for unordered input and DST fall-back times
+    existing_events.sort(key=lambda x: x[0])
     
-    suggestions = []
+    busy_starts = []
+    busy_ends = []
+    for start, end in existing_events:
+        if busy_ends and start <= busy_ends[-1]:
+            busy_ends[-1] = max(busy_ends[-1], end)
+        else:
+            busy_starts.append(start)
+            busy_ends.append(end)
     
     for task in tasks:
         app.logger.debug(f'Considering task: {task.title} (ID: {task.id})')
         
-        # Skip completed tasks
-        if task.status == 'Completed':
-            app.logger.debug(f'Skipping completed task: {task.title}')
-            continue
-        
         # Get task duration (default to 30 minutes if not specified)
         duration = task.estimated_minutes or 30
         
         # Find next available slot that doesn't overlap with existing events
         while True:
-            # Check if slot_time is during working hours (7 AM - 5 PM MST)
-            if slot_time.hour < 7:
-                slot_time = slot_time.replace(hour=7, minute=0)
-            elif slot_time.hour >= 17:
-                slot_time = (slot_time + timedelta(days=1)).replace(hour=7, minute=0)
-                # Skip weekends
-                while slot_time.weekday() >= 5:
-                    slot_time += timedelta(days=1)
+            # Every start (the first, or one after skipping a busy block) must be
+            # in working hours; a busy block can end overnight or on a weekend
+            slot_time = next_working_time(slot_time)
             
             slot_end = slot_time + timedelta(minutes=duration)
             
-            # Check for overlaps with existing events
-            has_overlap = False
-            for event in existing_events:
-                if slot_time < event['end'] and slot_end > event['start']:
-                    has_overlap = True
-                    # Move slot_time to after this event
-                    slot_time = event['end']
-                    break
+            # First busy interval ending after slot_time; if it starts before
+            # slot_end, skip past the whole busy block in one step
+            index = bisect_right(busy_ends, slot_time)
+            if index < len(busy_ends) and busy_starts[index] < slot_end:
+                slot_time = busy_ends[index]
+                continue
             
-            # Also check for overlaps with previously suggested times
-            for _, prev_time in suggestions:
-                prev_end = prev_time + timedelta(minutes=30)  # Assume 30 min for previous suggestions
-                if slot_time < prev_end and slot_end > prev_time:
-                    has_overlap = True
-                    # Move slot_time to after this suggestion
-                    slot_time = prev_end
-                    break
-            
-            if not has_overlap:
-                break
+            break
         
         app.logger.debug(f'Suggesting slot for task {task.title} at {slot_time}')
-        suggestions.append((task, slot_time))
+        yield task, slot_time
         
-        # Move slot_time to after this task for the next iteration
-        slot_time = slot_end
-    
-    return suggestions
+        # Move slot_time past this task for the next iteration; suggestions
+        # always reserve at least 30 minutes
+        slot_time += timedelta(minutes=max(duration, 30))
 
 def generate_scheduling_reason(task, dependencies, suggested_time):
     """Generate a human-readable reason for the scheduling suggestion"""
@@ -178,10 +277,8 @@ def generate_scheduling_reason(task, dependencies, suggested_time):
             reasons.append("All dependencies are completed")
     
     # Consider priority
-    if task.priority == 3:
-        reasons.append("High priority task")
-    elif task.priority == 2:
-        reasons.append("Medium priority task")
+    if task.priority in PRIORITY_REASONS:
+        reasons.append(PRIORITY_REASONS[task.priority])
     
     # Consider estimated duration
     if task.estimated_minutes:
@@ -189,10 +286,8 @@ def generate_scheduling_reason(task, dependencies, suggested_time):
         reasons.append(f"Task requires approximately {hours:.1f} hours")
     
     # Consider current status
-    if task.status == 'Not Started':
-        reasons.append("Task hasn't been started yet")
-    elif task.status == 'In Progress':
-        reasons.append("Task is already in progress")
+    if task.status in STATUS_REASONS:
+        reasons.append(STATUS_REASONS[task.status])
     
     # Format the suggested time
     local_time = suggested_time.astimezone()
@@ -201,38 +296,106 @@ def generate_scheduling_reason(task, dependencies, suggested_time):
     
     return " | ".join(reasons)
 
+def log_prompt_cache_usage(response, label):
+    """Log how much of the prompt OpenAI served from its prefix cache"""
+    usage = getattr(response, 'usage', None)
+    details = getattr(usage, 'prompt_tokens_details', None)
+    if usage is not None and details is not None:
+        app.logger.debug(f'{label}: {details.cached_tokens or 0} of {usage.prompt_tokens} prompt tokens cached')
+
 def analyze_task_dependencies(task_data):
     """Analyze task dependencies and generate insights using AI."""
     try:
         if not os.getenv('OPENAI_API_KEY'):
             return "OpenAI API key not found. Please set the OPENAI_API_KEY environment variable."
 
-        prompt = f"""Analyze these tasks and their dependencies:
-{json.dumps(task_data, indent=2)}
+        system_prompt = TASK_ANALYSIS_SYSTEM_PROMPT
+        prompt = TASK_ANALYSIS_PROMPT % orjson.dumps(task_data, option=orjson.OPT_INDENT_2).decode('utf-8')
 
-Please provide a concise analysis focusing on:
-1. Critical path tasks that need immediate attention
-2. Potential bottlenecks in task dependencies
-3. Scheduling recommendations based on priorities and dependencies
-4. Any risks or issues that need attention
-
-Keep the analysis practical and actionable."""
+        cache_key = get_ai_cache_key(SCHEDULER_MODEL, str(SCHEDULER_TEMPERATURE), system_prompt, prompt)
+        cached = get_cached_ai_response(cache_key)
+        if cached is not None:
+            app.logger.debug('Using cached task analysis')
+            return cached
 
         response = client.chat.completions.create(
-            model="gpt-4",
+            model=SCHEDULER_MODEL,
             messages=[
-                {"role": "system", "content": "You are a project management assistant analyzing task dependencies and providing insights."},
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=1000,
-            temperature=0.7
+            # Scale the output budget with the number of tasks being analyzed
+            max_tokens=min(1000, 200 + 80 * len(task_data)),
+            temperature=SCHEDULER_TEMPERATURE
         )
         
-        return response.choices[0].message.content
+        log_prompt_cache_usage(response, 'Task analysis')
+        analysis = response.choices[0].message.content
+        set_cached_ai_response(cache_key, analysis)
+        return analysis
     except Exception as e:
         app.logger.error(f"Error in AI analysis: {str(e)}")
         return f"Error generating analysis: {str(e)}. Please ensure OPENAI_API_KEY is set correctly."
 
+# Background jobs for slow endpoints; finished results are kept for an hour for polling
+job_executor = ThreadPoolExecutor(max_workers=8)
+jobs = TTLCache(maxsize=1024, ttl=60 * 60)
+jobs_lock = threading.Lock()
+
+def submit_job(fn, *args):
+    """Run fn(*args) on the job executor and return an id for polling its result"""
+    job_id = uuid.uuid4().hex
+    future = job_executor.submit(fn, *args)
+    with jobs_lock:
+        jobs[job_id] = future
+    return job_id
+
+def get_job_response(job_id):
+    """Build the polling response for a background job"""
+    with jobs_lock:
+        future = jobs.get(job_id)
+    if future is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if not future.done():
+        return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+    try:
+        result = future.result()
+    except Exception as e:
+        app.logger.error(f"Background job {job_id} failed: {str(e)}")
+        return jsonify({'job_id': job_id, 'status': 'failed', 'error': str(e)}), 500
+    return jsonify({'job_id': job_id, 'status': 'done', 'result': result})
+
+def get_table_etag(*table_names):
+    """Build an ETag from the SyncMeta versions of the tables a response reads"""
+    versions = dict(db.session.query(SyncMeta.table_name, SyncMeta.version)
+                    .filter(SyncMeta.table_name.in_(table_names)).all())
+    return '-'.join(f'{name}.{versions.get(name, 0)}' for name in table_names)
+
+# Flask-Compress appends the encoding to the ETag of compressed responses
+COMPRESSED_ETAG_SUFFIXES = (':gzip', ':br', ':deflate')
+
+def strip_compressed_etag_suffix(tag):
+    for suffix in COMPRESSED_ETAG_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)]
+    return tag
+
+def not_modified(etag):
+    """Return a 304 response if the client already holds this ETag, else None"""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag or etag in {strip_compressed_etag_suffix(tag) for tag in if_none_match}:
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response
+    return None
+
+def with_etag(response, etag):
+    """Tag a response so browsers revalidate it with If-None-Match"""
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
 @app.route('/')
 def index():
     app.logger.info('Serving index.html')
@@ -251,22 +414,39 @@ def serve_static(path):
         app.logger.error(f'Error serving static file {path}: {str(e)}')
         return str(e), 404
 
+def parse_client_datetime(data, iso_key, ms_key):
+    """
+    Parse a client-supplied time into an MST-aware datetime.
+    Epoch milliseconds under ms_key are preferred since they skip string parsing;
+    otherwise the ISO 8601 string under iso_key is used.
+    """
+    if data.get(ms_key) is not None:
+        try:
+            return datetime.fromtimestamp(int(data[ms_key]) / 1000, MST)
+        except (TypeError, OverflowError, OSError) as e:
+            raise ValueError(f'Invalid {ms_key}: {data[ms_key]}') from e
+    
+    value = datetime.fromisoformat(data[iso_key].replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        return MST.localize(value)
+    return value.astimezone(MST)
+
 @app.route('/api/calendar', methods=['GET'])
 def get_calendar_events():
-    events = Calendar.query.all()
-    return jsonify([{
-        'id': event.id,
-        'title': event.title,
-        'start': event.start_time.astimezone(pytz.timezone('America/Denver')).isoformat(),
-        'end': event.end_time.astimezone(pytz.timezone('America/Denver')).isoformat(),
-        'description': event.description,
-        'project_id': event.project_id,
-        'project_name': event.project.name if event.project_id else None,
-        'task_id': event.task_id,
-        'event_type': event.event_type,
-        'backgroundColor': getattr(event.project, 'color', None) if event.project_id else None,
-        'borderColor': getattr(event.project, 'color', None) if event.project_id else None
-    } for event in events])
+    etag = get_table_etag('calendar', 'project')
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    # Read only the needed columns, joining the project once per row
+    events = db.session.query(
+        Calendar.id, Calendar.title, Calendar.start_time, Calendar.end_time,
+        Calendar.description, Calendar.project_id, Calendar.task_id, Calendar.event_type,
+        Project.name.label('project_name'), Project.color.label('project_color')
+    ).outerjoin(Project, Calendar.project_id == Project.id).all()
+    return with_etag(jsonify([
+        calendar_event_dict(event, event.project_name, event.project_color) for event in events
+    ]), etag)
 
 @app.route('/api/calendar', methods=['POST'])
 def add_calendar_event():
@@ -276,21 +456,9 @@ def add_calendar_event():
         
         try:
             # Parse times and ensure they're in MST
-            mst = pytz.timezone('America/Denver')
-            start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
+            start_time = parse_client_datetime(data, 'start_time', 'start_ms')
+            end_time = parse_client_datetime(data, 'end_time', 'end_ms')
             
-            # Convert to MST if not already
-            if start_time.tzinfo is None:
-                start_time = mst.localize(start_time)
-            else:
-                start_time = start_time.astimezone(mst)
-                
-            if end_time.tzinfo is None:
-                end_time = mst.localize(end_time)
-            else:
-                end_time = end_time.astimezone(mst)
-                
             app.logger.debug(f"Parsed MST start_time: {start_time}, end_time: {end_time}")
             
         except ValueError as e:
@@ -307,23 +475,14 @@ def add_calendar_event():
             event_type=data.get('event_type', 'event')
         )
         db.session.add(event)
+        # Serialize before committing so the expired instance isn't reloaded
+        db.session.flush()
+        event_dict = event.to_dict()
         db.session.commit()
         
-        app.logger.debug(f"Stored event with MST start_time: {event.start_time}, end_time: {event.end_time}")
+        app.logger.debug(f"Stored event with MST start_time: {start_time}, end_time: {end_time}")
         
-        return jsonify({
-            'id': event.id,
-            'title': event.title,
-            'start': event.start_time.isoformat(),
-            'end': event.end_time.isoformat(),
-            'description': event.description,
-            'project_id': event.project_id,
-            'project_name': event.project.name if event.project_id else None,
-            'task_id': event.task_id,
-            'event_type': event.event_type,
-            'backgroundColor': getattr(event.project, 'color', None) if event.project_id else None,
-            'borderColor': getattr(event.project, 'color', None) if event.project_id else None
-        })
+        return jsonify(event_dict)
     except Exception as e:
         app.logger.error(f"Error adding calendar event: {str(e)}")
         return jsonify({'error': f'Failed to add event: {str(e)}'}), 500
@@ -341,19 +500,8 @@ def handle_calendar_event(event_id):
         data = request.json
         
         # Parse and convert times to MST
-        mst = pytz.timezone('America/Denver')
-        start_time = datetime.fromisoformat(data['start_time'].replace('Z', '+00:00'))
-        end_time = datetime.fromisoformat(data['end_time'].replace('Z', '+00:00'))
-        
-        if start_time.tzinfo is None:
-            start_time = mst.localize(start_time)
-        else:
-            start_time = start_time.astimezone(mst)
-            
-        if end_time.tzinfo is None:
-            end_time = mst.localize(end_time)
-        else:
-            end_time = end_time.astimezone(mst)
+        start_time = parse_client_datetime(data, 'start_time', 'start_ms')
+        end_time = parse_client_datetime(data, 'end_time', 'end_ms')
         
         event.title = data['title']
         event.description = data.get('description')
@@ -363,21 +511,11 @@ def handle_calendar_event(event_id):
         event.task_id = data.get('task_id')
         event.event_type = data.get('event_type', event.event_type)
         
+        db.session.flush()
+        event_dict = event.to_dict()
         db.session.commit()
         
-        return jsonify({
-            'id': event.id,
-            'title': event.title,
-            'start': event.start_time.isoformat(),
-            'end': event.end_time.isoformat(),
-            'description': event.description,
-            'project_id': event.project_id,
-            'project_name': event.project.name if event.project_id else None,
-            'task_id': event.task_id,
-            'event_type': event.event_type,
-            'backgroundColor': getattr(event.project, 'color', None) if event.project_id else None,
-            'borderColor': getattr(event.project, 'color', None) if event.project_id else None
-        })
+        return jsonify(event_dict)
     except ValueError as e:
         app.logger.error(f"Date parsing error: {str(e)}")
         return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
@@ -408,16 +546,23 @@ def handle_projects():
             'color': project.color
         })
     
-    projects = Project.query.all()
-    return jsonify([{
+    etag = get_table_etag('project')
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    projects = db.session.query(
+        Project.id, Project.name, Project.description, Project.status, Project.priority, Project.color
+    ).all()
+    return with_etag(jsonify([{
         'id': project.id,
         'name': project.name,
         'description': project.description,
         'status': project.status,
         'priority': project.priority,
-        'priority_label': project.priority_label,
+        'priority_label': get_priority_label(project.priority),
         'color': project.color
-    } for project in projects])
+    } for project in projects]), etag)
 
 @app.route('/api/projects/<int:project_id>', methods=['GET', 'PUT', 'DELETE'])
 def handle_project(project_id):
@@ -437,8 +582,16 @@ def handle_project(project_id):
         })
     
     if request.method == 'DELETE':
-        # Delete associated tasks first
-        Task.query.filter_by(project_id=project_id).delete()
+        # Delete associated tasks first, along with the status updates and
+        # dependency links that point at them, one bulk statement per table
+        task_ids = select(Task.id).where(Task.project_id == project_id)
+        db.session.execute(delete(StatusUpdate).where(StatusUpdate.task_id.in_(task_ids)))
+        db.session.execute(task_dependencies.delete().where(or_(
+            task_dependencies.c.task_id.in_(task_ids),
+            task_dependencies.c.dependency_id.in_(task_ids)
+        )))
+        db.session.execute(update(Calendar).where(Calendar.task_id.in_(task_ids)).values(task_id=None))
+        db.session.execute(delete(Task).where(Task.project_id == project_id))
         db.session.delete(project)
         db.session.commit()
         return jsonify({'message': 'Project and associated tasks deleted successfully'})
@@ -460,6 +613,37 @@ def handle_project(project_id):
         app.logger.error(f"Error updating project: {str(e)}")
         return jsonify({'error': 'Failed to update project'}), 500
 
+def serialize_task_row(row, dependencies, dependent_tasks):
+    """
+    Build the Task.to_dict() payload from a column query row.
+    Datetimes are left for orjson to encode, which matches isoformat().
+    """
+    return {
+        'id': row.id,
+        'title': row.title,
+        'description': row.description,
+        'status': row.status,
+        'current_status': row.current_status,
+        'priority': row.priority,
+        'priority_label': get_priority_label(row.priority),
+        'estimated_minutes': row.estimated_minutes,
+        'actual_duration': row.actual_duration,
+        'project_id': row.project_id,
+        'project': {
+            'id': row.project_id,
+            'name': row.project_name,
+            'color': row.project_color
+        } if row.project_name is not None else None,
+        'project_name': row.project_name,
+        'ticket_number': row.ticket_number,
+        'created_at': row.created_at,
+        'started_at': row.started_at,
+        'completed_at': row.completed_at,
+        'progress': TASK_PROGRESS.get(row.status, 0),
+        'dependencies': dependencies,
+        'dependent_tasks': dependent_tasks
+    }
+
 @app.route('/api/tasks', methods=['GET', 'POST'])
 def handle_tasks():
     try:
@@ -488,12 +672,9 @@ def handle_tasks():
                 ticket_number=data.get('ticket_number')
             )
             
-            # Handle dependencies
-            if 'dependencies' in data:
-                for dep_id in data['dependencies']:
-                    dep_task = db.session.get(Task, dep_id)
-                    if dep_task:
-                        new_task.dependencies.append(dep_task)
+            # Handle dependencies, resolving all ids in one query
+            if data.get('dependencies'):
+                new_task.dependencies = Task.query.filter(Task.id.in_(data['dependencies'])).all()
             
             try:
                 db.session.add(new_task)
@@ -508,15 +689,32 @@ def handle_tasks():
         # GET request
         try:
             app.logger.info('Fetching all tasks')
-            tasks = Task.query.all()
+            etag = get_table_etag('task', 'project')
+            cached = not_modified(etag)
+            if cached:
+                return cached
+            
+            tasks = db.session.query(
+                Task.id, Task.title, Task.description, Task.status, Task.current_status,
+                Task.priority, Task.estimated_minutes, Task.actual_duration, Task.project_id,
+                Task.ticket_number, Task.created_at, Task.started_at, Task.completed_at,
+                Project.name.label('project_name'), Project.color.label('project_color')
+            ).outerjoin(Project, Task.project_id == Project.id).all()
+            
+            # Resolve dependencies in both directions from the association table
+            dependencies = defaultdict(list)
+            dependent_tasks = defaultdict(list)
+            for task_id, dependency_id in db.session.query(task_dependencies.c.task_id, task_dependencies.c.dependency_id):
+                dependencies[task_id].append(dependency_id)
+                dependent_tasks[dependency_id].append(task_id)
             app.logger.info(f'Found {len(tasks)} tasks')
             
             # Convert tasks to dictionary and log the first task for debugging
-            tasks_dict = [task.to_dict() for task in tasks]
+            tasks_dict = [serialize_task_row(task, dependencies[task.id], dependent_tasks[task.id]) for task in tasks]
             if tasks_dict:
                 app.logger.debug(f'First task data: {tasks_dict[0]}')
             
-            return jsonify({'tasks': tasks_dict})
+            return with_etag(jsonify({'tasks': tasks_dict}), etag)
         except Exception as e:
             app.logger.error(f"Error fetching tasks: {str(e)}")
             return jsonify({'error': f'Failed to fetch tasks: {str(e)}'}), 500
@@ -525,9 +723,30 @@ def handle_tasks():
         app.logger.error(f"Error in handle_tasks: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def update_task_fields(task_id, data):
+    """Apply plain field edits (no status or dependency changes) with a single UPDATE"""
+    if 'project_id' in data and not db.session.get(Project, data['project_id']):
+        return jsonify({'error': 'Selected project does not exist'}), 400
+    
+    fields = ['title', 'description', 'priority', 'project_id', 'estimated_minutes', 'ticket_number', 'current_status']
+    updates = {field: data[field] for field in fields if field in data}
+    if not Task.query.filter_by(id=task_id).update(updates):
+        return jsonify({'error': 'Task not found'}), 404
+    db.session.commit()
+    return '', 204
+
 @app.route('/api/tasks/<int:task_id>', methods=['GET', 'PUT', 'DELETE'])
 def handle_task(task_id):
     try:
+        # Clients that don't need the task back can skip loading and
+        # re-serializing it for simple field edits
+        if request.method == 'PUT' and request.headers.get('Prefer') == 'return=minimal':
+            data = request.get_json()
+            if not data.get('title'):
+                return jsonify({'error': 'Title is required'}), 400
+            if 'status' not in data and 'dependencies' not in data:
+                return update_task_fields(task_id, data)
+        
         task = db.session.get(Task, task_id)
         if task is None:
             return jsonify({'error': 'Task not found'}), 404
@@ -561,18 +780,16 @@ def handle_task(task_id):
             
             # Update dependencies if provided
             if 'dependencies' in data:
-                task.dependencies = []  # Clear existing dependencies
-                for dep_id in data['dependencies']:
-                    dep_task = db.session.get(Task, dep_id)
-                    if dep_task:
-                        task.dependencies.append(dep_task)
+                # Replace existing dependencies, resolving all ids in one query
+                task.dependencies = Task.query.filter(Task.id.in_(data['dependencies'])).all() if data['dependencies'] else []
             
             # Update timestamps based on status changes
             if 'status' in data:
+                now = datetime.utcnow()
                 if data['status'] == 'In Progress' and not task.started_at:
-                    task.started_at = datetime.utcnow()
+                    task.started_at = now
                 elif data['status'] == 'Completed' and not task.completed_at:
-                    task.completed_at = datetime.utcnow()
+                    task.completed_at = now
                     if task.started_at:
                         task.actual_duration = (task.completed_at - task.started_at).total_seconds() / 60
             
@@ -602,27 +819,38 @@ def update_task_status(task_id):
     if not new_status:
         return jsonify({'error': 'Status is required'}), 400
     
-    # Create status update
-    status_update = StatusUpdate(
-        task_id=task_id,
-        status=new_status,
-        notes=notes,
-        created_at=datetime.now(pytz.UTC)
-    )
+    # One timestamp (naive UTC, as SQLite returns it) for the update and the task
+    now = datetime.utcnow()
     
     # Update task status
     task.status = new_status
     if new_status == 'Completed':
-        task.completed_at = datetime.now(pytz.UTC)
+        task.completed_at = now
     elif task.completed_at:  # If task is being un-completed
         task.completed_at = None
     
-    db.session.add(status_update)
+    # Insert the status update with a single statement; the response is built
+    # from the values just written, so nothing is reloaded after the commit
+    status_update_id = db.session.scalar(
+        insert(StatusUpdate).values(
+            task_id=task_id,
+            status=new_status,
+            notes=notes,
+            created_at=now
+        ).returning(StatusUpdate.id)
+    )
+    status_update_dict = {
+        'id': status_update_id,
+        'task_id': task_id,
+        'status': new_status,
+        'notes': notes,
+        'created_at': now.isoformat()
+    }
     db.session.commit()
     
     return jsonify({
         'message': 'Status updated successfully',
-        'status_update': status_update.to_dict()
+        'status_update': status_update_dict
     })
 
 @app.route('/api/tasks/<int:task_id>/status-history', methods=['GET'])
@@ -631,8 +859,65 @@ def get_task_status_history(task_id):
     if task is None:
         return jsonify({'error': 'Task not found'}), 404
     
-    status_updates = StatusUpdate.query.filter_by(task_id=task_id).order_by(StatusUpdate.created_at.desc()).all()
-    return jsonify([update.to_dict() for update in status_updates])
+    # Read the StatusUpdate.to_dict() columns directly, newest first; ?limit= caps the history
+    query = db.session.query(
+        StatusUpdate.id, StatusUpdate.task_id, StatusUpdate.status, StatusUpdate.notes, StatusUpdate.created_at
+    ).filter(StatusUpdate.task_id == task_id).order_by(StatusUpdate.created_at.desc())
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        query = query.limit(max(limit, 0))
+    return jsonify([dict(update._mapping) for update in query])
+
+def format_schedule_suggestion(task, suggested_time):
+    """Convert a (task, suggested_time) pair into the API response format"""
+    return {
+        'task_id': task.id,
+        'task_title': task.title,
+        'suggested_time': suggested_time.isoformat(),
+        'duration': task.estimated_minutes,
+        'reason': generate_scheduling_reason(task, [], suggested_time)
+    }
+
+def get_upcoming_calendar_events(now):
+    """Calendar events that have not ended by now; earlier events cannot block a suggestion"""
+    # Ordering here keeps the scheduler's sort a single linear pass
+    return Calendar.query.filter(
+        Calendar.end_time > now
+    ).order_by(Calendar.start_time).all()
+
+def get_unscheduled_tasks(scheduled_task_ids):
+    """Incomplete tasks that are not already on the calendar"""
+    return Task.query.filter(
+        Task.status != 'Completed',
+        ~Task.id.in_([int(id) for id in scheduled_task_ids])  # Convert string IDs to integers
+    ).all()
+
+def run_schedule_suggestions_job(scheduled_task_ids):
+    """Compute formatted schedule suggestions on a job thread"""
+    with app.app_context():
+        tasks = get_unscheduled_tasks(scheduled_task_ids)
+        if not tasks:
+            return []
+        now = datetime.now(MST)
+        calendar_events = get_upcoming_calendar_events(now)
+        return [
+            format_schedule_suggestion(task, suggested_time)
+            for task, suggested_time in iter_schedule_suggestions(tasks, calendar_events, now)
+        ]
+
+@app.route('/api/schedule/suggestions/jobs', methods=['POST'])
+def submit_schedule_suggestions_job():
+    """Start computing schedule suggestions in the background and return a job id"""
+    data = request.get_json(silent=True) or {}
+    job_id = submit_job(run_schedule_suggestions_job, data.get('scheduled_task_ids', []))
+    response = jsonify({'job_id': job_id, 'status': 'pending'})
+    response.headers['Location'] = url_for('get_schedule_suggestions_job', job_id=job_id)
+    return response, 202
+
+@app.route('/api/schedule/suggestions/jobs/<job_id>', methods=['GET'])
+def get_schedule_suggestions_job(job_id):
+    """Poll a background schedule suggestions job"""
+    return get_job_response(job_id)
 
 @app.route('/api/schedule/suggestions', methods=['POST'])
 def get_schedule_suggestions():
@@ -642,10 +927,7 @@ def get_schedule_suggestions():
         app.logger.debug(f'Already scheduled task IDs: {scheduled_task_ids}')
         
         # Get all tasks that are not completed and not already scheduled
-        tasks = Task.query.filter(
-            Task.status != 'Completed',
-            ~Task.id.in_([int(id) for id in scheduled_task_ids])  # Convert string IDs to integers
-        ).all()
+        tasks = get_unscheduled_tasks(scheduled_task_ids)
         
         app.logger.debug(f'Found {len(tasks)} unscheduled tasks')
         for task in tasks:
@@ -655,24 +937,26 @@ def get_schedule_suggestions():
             app.logger.debug('No unscheduled tasks found')
             return jsonify([])
         
-        # Get all calendar events for scheduling context
-        calendar_events = Calendar.query.all()
+        # Get the calendar events that can still conflict with a suggestion
+        now = datetime.now(MST)
+        calendar_events = get_upcoming_calendar_events(now)
         app.logger.debug(f'Found {len(calendar_events)} calendar events')
         
+        # Stream suggestions as newline-delimited JSON when the client asks for it
+        if request.accept_mimetypes.best == 'application/x-ndjson':
+            def generate():
+                for task, suggested_time in iter_schedule_suggestions(tasks, calendar_events, now):
+                    yield orjson.dumps(format_schedule_suggestion(task, suggested_time), option=orjson.OPT_APPEND_NEWLINE)
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
         # Generate suggestions
-        suggestions = generate_schedule_suggestions(tasks, calendar_events)
+        suggestions = generate_schedule_suggestions(tasks, calendar_events, now)
         app.logger.debug(f'Generated {len(suggestions)} suggestions')
         
         # Format suggestions for response
         formatted_suggestions = []
         for task, suggested_time in suggestions:
-            suggestion = {
-                'task_id': task.id,
-                'task_title': task.title,
-                'suggested_time': suggested_time.isoformat(),
-                'duration': task.estimated_minutes,
-                'reason': generate_scheduling_reason(task, [], suggested_time)
-            }
+            suggestion = format_schedule_suggestion(task, suggested_time)
             app.logger.debug(f'Formatted suggestion: {suggestion}')
             formatted_suggestions.append(suggestion)
         
@@ -681,12 +965,33 @@ def get_schedule_suggestions():
         app.logger.error(f'Error generating schedule suggestions: {str(e)}')
         return jsonify({'error': str(e)}), 500
 
+def build_task_analysis_data(tasks):
+    """
+    Summarize tasks (with dependencies and project loaded) for the AI analysis prompt.
+    Tasks and dependency titles are sorted so the same data always produces the
+    same prompt, and therefore the same AI response cache key.
+    """
+    return [{
+        'id': task.id,
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'priority': task.priority,
+        'estimated_minutes': task.estimated_minutes,
+        'ticket_number': task.ticket_number,
+        'dependencies': sorted(dep.title for dep in task.dependencies),
+        'project': task.project.name if task.project else None,
+        'current_status': task.current_status
+    } for task in sorted(tasks, key=lambda t: t.id)]
+
 @app.route('/api/tasks/analyze', methods=['GET'])
-@cross_origin()
 def analyze_tasks():
     try:
         # Get all incomplete tasks
-        tasks = Task.query.filter(Task.status != 'Completed').all()
+        tasks = Task.query.options(
+            joinedload(Task.project),
+            selectinload(Task.dependencies)
+        ).filter(Task.status != 'Completed').all()
         if not tasks:
             return jsonify({
                 'message': 'No tasks to analyze',
@@ -694,22 +999,7 @@ def analyze_tasks():
             })
         
         # Prepare task data for analysis
-        task_data = []
-        for task in tasks:
-            dependencies = [db.session.get(Task, dep.id) for dep in task.dependencies]
-            task_info = {
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'status': task.status,
-                'priority': task.priority,
-                'estimated_minutes': task.estimated_minutes,
-                'ticket_number': task.ticket_number,
-                'dependencies': [dep.title for dep in dependencies if dep],
-                'project': task.project.name if task.project else None,
-                'current_status': task.current_status
-            }
-            task_data.append(task_info)
+        task_data = build_task_analysis_data(tasks)
         
         # Generate AI analysis
         analysis = analyze_task_dependencies(task_data)
@@ -723,18 +1013,59 @@ def analyze_tasks():
         app.logger.error(f"Error analyzing tasks: {str(e)}")
         return jsonify({'error': 'Failed to analyze tasks', 'analysis': 'Error generating analysis. Please try again later.'}), 500
 
+@app.route('/api/ai/full-analysis', methods=['POST'])
+def full_analysis():
+    """Return schedule suggestions and the AI task analysis in a single response"""
+    try:
+        data = request.get_json(silent=True) or {}
+        scheduled_task_ids = {int(id) for id in data.get('scheduled_task_ids', [])}
+        
+        tasks = Task.query.options(
+            joinedload(Task.project),
+            selectinload(Task.dependencies)
+        ).filter(Task.status != 'Completed').all()
+        if not tasks:
+            return jsonify({
+                'suggestions': [],
+                'analysis': 'No tasks found to analyze.'
+            })
+        
+        # Suggestions are computed locally; only the analysis needs OpenAI.
+        # Skip the calendar query when every task is already scheduled.
+        suggestions = []
+        unscheduled_tasks = [task for task in tasks if task.id not in scheduled_task_ids]
+        if unscheduled_tasks:
+            now = datetime.now(MST)
+            calendar_events = get_upcoming_calendar_events(now)
+            suggestions = [
+                format_schedule_suggestion(task, suggested_time)
+                for task, suggested_time in iter_schedule_suggestions(unscheduled_tasks, calendar_events, now)
+            ]
+        
+        analysis = analyze_task_dependencies(build_task_analysis_data(tasks))
+        
+        return jsonify({
+            'suggestions': suggestions,
+            'analysis': analysis
+        })
+    except Exception as e:
+        app.logger.error(f"Error generating full analysis: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/project-status', methods=['GET'])
 def get_project_status():
-    projects = Project.query.all()
-    status_data = []
+    # Count total and completed tasks for every project in a single query
+    rows = db.session.query(
+        Project.name,
+        func.count(Task.id),
+        func.sum(case((Task.status == 'Completed', 1), else_=0))
+    ).outerjoin(Task, Task.project_id == Project.id).group_by(Project.id).order_by(Project.id).all()
     
-    for project in projects:
-        tasks = Task.query.filter_by(project_id=project.id).all()
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.status == 'Completed'])
-        
+    status_data = []
+    for project_name, total_tasks, completed_tasks in rows:
+        completed_tasks = completed_tasks or 0
         status_data.append({
-            'project_name': project.name,
+            'project_name': project_name,
             'total_tasks': total_tasks,
             'completed_tasks': completed_tasks,
             'progress': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
@@ -757,19 +1088,14 @@ def approve_suggestion():
         if not task:
             return jsonify({'error': 'Task not found'}), 404
 
-        suggested_time = data.get('suggested_time')
         duration = int(data.get('duration', 60))  # Default to 60 minutes if not specified
         
-        if not suggested_time:
+        if not data.get('suggested_time') and data.get('suggested_time_ms') is None:
             return jsonify({'error': 'Suggested time is required'}), 400
 
         try:
             # Parse the time and ensure it's in MST
-            mst = pytz.timezone('America/Denver')
-            start_time = datetime.fromisoformat(suggested_time.replace('Z', '+00:00'))
-            if start_time.tzinfo is None:
-                start_time = mst.localize(start_time)
-            start_time = start_time.astimezone(mst)
+            start_time = parse_client_datetime(data, 'suggested_time', 'suggested_time_ms')
         except ValueError:
             return jsonify({'error': 'Invalid date format'}), 400
 
@@ -789,7 +1115,7 @@ def approve_suggestion():
         try:
             # Update task status to scheduled
             task.status = 'In Progress'
-            task.started_at = datetime.now(pytz.UTC)
+            task.started_at = datetime.now(UTC)
             
             # Add event and commit changes
             db.session.add(event)
@@ -819,85 +1145,187 @@ def approve_suggestion():
         app.logger.error(f"Error approving schedule suggestion: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/backup', methods=['POST'])
-def create_backup():
-    """Create a backup of the current database state."""
+@app.route('/api/schedule/approve_batch', methods=['POST'])
+def approve_suggestions_batch():
+    """Add several approved suggestions to the calendar in one transaction"""
+    data = request.get_json()
+    
     try:
-        # Create timestamp for the backup file
-        mst = pytz.timezone('America/Denver')
-        timestamp = datetime.now(mst).strftime('%Y%m%d_%H%M%S')
-        backup_filename = f'backup_{timestamp}.json'
+        suggestions = data.get('suggestions') if isinstance(data, dict) else data
+        if not suggestions:
+            return jsonify({'error': 'At least one suggestion is required'}), 400
+        if not isinstance(suggestions, list):
+            return jsonify({'error': 'suggestions must be a list'}), 400
         
-        # Get all data from database
-        projects = Project.query.all()
-        tasks = Task.query.all()
-        calendar_events = Calendar.query.all()
+        # Validate and parse every suggestion before touching the database
+        parsed = []
+        for index, suggestion in enumerate(suggestions):
+            if not isinstance(suggestion, dict):
+                return jsonify({'error': f'Suggestion must be an object (suggestion {index})'}), 400
+            
+            task_id = suggestion.get('task_id')
+            if task_id is None:
+                return jsonify({'error': f'Task ID is required (suggestion {index})'}), 400
+            if isinstance(task_id, bool) or not isinstance(task_id, (int, str)):
+                return jsonify({'error': f'Invalid task_id (suggestion {index})'}), 400
+            try:
+                task_id = int(task_id)
+            except ValueError:
+                return jsonify({'error': f'Invalid task_id (suggestion {index})'}), 400
+            
+            try:
+                duration = int(suggestion.get('duration', 60))
+            except (TypeError, ValueError):
+                return jsonify({'error': f'Invalid duration (suggestion {index})'}), 400
+            
+            if not suggestion.get('suggested_time') and suggestion.get('suggested_time_ms') is None:
+                return jsonify({'error': f'Suggested time is required (suggestion {index})'}), 400
+            try:
+                start_time = parse_client_datetime(suggestion, 'suggested_time', 'suggested_time_ms')
+            except (TypeError, AttributeError, ValueError):
+                field = 'suggested_time_ms' if suggestion.get('suggested_time_ms') is not None else 'suggested_time'
+                return jsonify({'error': f'Invalid {field} (suggestion {index})'}), 400
+            
+            parsed.append((task_id, duration, start_time))
         
-        # Create backup data structure
-        backup_data = {
-            'version': '1.0',
-            'timestamp': datetime.now(mst).isoformat(),
-            'projects': [],
-            'tasks': [],
-            'calendar_events': []
+        # Load every referenced task with a single IN query
+        tasks = {
+            task.id: task
+            for task in Task.query.filter(Task.id.in_({task_id for task_id, _, _ in parsed})).all()
         }
-
-        # Add projects
-        for project in projects:
-            project_data = {
-                'id': project.id,
-                'name': project.name,
-                'description': project.description,
-                'status': project.status,
-                'priority': project.priority,
-                'color': project.color,
-                'created_at': project.created_at.isoformat() if project.created_at else None
-            }
-            backup_data['projects'].append(project_data)
-
-        # Add tasks
-        for task in tasks:
-            task_data = {
-                'id': task.id,
+        
+        started_at = datetime.now(UTC)
+        event_rows = []
+        status_rows = []
+        for task_id, duration, start_time in parsed:
+            task = tasks.get(task_id)
+            if not task:
+                return jsonify({'error': f'Task not found: {task_id}'}), 404
+            
+            event_rows.append({
                 'title': task.title,
-                'description': task.description,
-                'status': task.status,
-                'current_status': task.current_status,
-                'priority': task.priority,
-                'estimated_minutes': task.estimated_minutes,
+                'description': f"Scheduled task: {task.description}" if task.description else None,
+                'start_time': start_time,
+                'end_time': start_time + timedelta(minutes=duration),
                 'project_id': task.project_id,
-                'ticket_number': task.ticket_number,
-                'created_at': task.created_at.isoformat() if task.created_at else None,
-                'started_at': task.started_at.isoformat() if task.started_at else None,
-                'completed_at': task.completed_at.isoformat() if task.completed_at else None,
-                'dependencies': [dep.id for dep in task.dependencies] if task.dependencies else []
-            }
-            backup_data['tasks'].append(task_data)
-
-        # Add calendar events
-        for event in calendar_events:
-            event_data = {
-                'id': event.id,
-                'title': event.title,
-                'description': event.description,
-                'start_time': event.start_time.isoformat() if event.start_time else None,
-                'end_time': event.end_time.isoformat() if event.end_time else None,
-                'project_id': event.project_id,
-                'task_id': event.task_id,
-                'event_type': event.event_type
-            }
-            backup_data['calendar_events'].append(event_data)
-        
-        # Create backups directory if it doesn't exist
-        backup_dir = os.path.join(app.root_path, 'backups')
-        os.makedirs(backup_dir, exist_ok=True)
+                'task_id': task.id,
+                'event_type': 'task'
+            })
+            status_rows.append({
+                'task_id': task.id,
+                'status': 'In Progress',
+                'notes': f'Task scheduled for {start_time.strftime("%Y-%m-%d %H:%M")}',
+                'created_at': started_at
+            })
         
-        # Save backup file
-        backup_path = os.path.join(backup_dir, backup_filename)
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)
+        try:
+            for task in tasks.values():
+                task.status = 'In Progress'
+                task.started_at = started_at
+            
+            # Multi-row inserts and a single commit for the whole batch; event_ids
+            # come back in the same order as the suggestions
+            event_ids = db.session.scalars(insert(Calendar).returning(Calendar.id, sort_by_parameter_order=True), event_rows).all()
+            db.session.execute(insert(StatusUpdate), status_rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Database error while scheduling tasks: {str(e)}")
+            return jsonify({'error': 'Database error occurred while scheduling tasks'}), 500
         
-        app.logger.info(f"Backup created successfully: {backup_filename}")
+        return jsonify({
+            'message': f'{len(event_ids)} schedule suggestions approved',
+            'event_ids': event_ids
+        })
+    
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f"Error approving schedule suggestions: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def write_backup_file():
+    """Write the current database state to a JSON file in backups/ and return its filename"""
+    # Create timestamp for the backup file
+    timestamp = datetime.now(MST).strftime('%Y%m%d_%H%M%S')
+    backup_filename = f'backup_{timestamp}.json'
+    
+    # Get all data from database
+    projects = Project.query.all()
+    tasks = Task.query.options(selectinload(Task.dependencies)).all()
+    calendar_events = Calendar.query.all()
+    
+    # Create backup data structure
+    backup_data = {
+        'version': '1.0',
+        'timestamp': datetime.now(MST).isoformat(),
+        'projects': [],
+        'tasks': [],
+        'calendar_events': []
+    }
+
+    # Add projects
+    for project in projects:
+        project_data = {
+            'id': project.id,
+            'name': project.name,
+            'description': project.description,
+            'status': project.status,
+            'priority': project.priority,
+            'color': project.color,
+            'created_at': project.created_at.isoformat() if project.created_at else None
+        }
+        backup_data['projects'].append(project_data)
+
+    # Add tasks
+    for task in tasks:
+        task_data = {
+            'id': task.id,
+            'title': task.title,
+            'description': task.description,
+            'status': task.status,
+            'current_status': task.current_status,
+            'priority': task.priority,
+            'estimated_minutes': task.estimated_minutes,
+            'project_id': task.project_id,
+            'ticket_number': task.ticket_number,
+            'created_at': task.created_at.isoformat() if task.created_at else None,
+            'started_at': task.started_at.isoformat() if task.started_at else None,
+            'completed_at': task.completed_at.isoformat() if task.completed_at else None,
+            'dependencies': [dep.id for dep in task.dependencies] if task.dependencies else []
+        }
+        backup_data['tasks'].append(task_data)
+
+    # Add calendar events
+    for event in calendar_events:
+        event_data = {
+            'id': event.id,
+            'title': event.title,
+            'description': event.description,
+            'start_time': event.start_time.isoformat() if event.start_time else None,
+            'end_time': event.end_time.isoformat() if event.end_time else None,
+            'project_id': event.project_id,
+            'task_id': event.task_id,
+            'event_type': event.event_type
+        }
+        backup_data['calendar_events'].append(event_data)
+    
+    # Create backups directory if it doesn't exist
+    backup_dir = os.path.join(app.root_path, 'backups')
+    os.makedirs(backup_dir, exist_ok=True)
+    
+    # Save backup file
+    backup_path = os.path.join(backup_dir, backup_filename)
+    with open(backup_path, 'w', encoding='utf-8') as f:
+        json.dump(backup_data, f, indent=2, ensure_ascii=False)
+    
+    app.logger.info(f"Backup created successfully: {backup_filename}")
+    return backup_filename
+
+@app.route('/api/backup', methods=['POST'])
+def create_backup():
+    """Create a backup of the current database state."""
+    try:
+        backup_filename = write_backup_file()
         
         # Return backup info without download URL
         return jsonify({
@@ -950,21 +1378,24 @@ def list_backups():
         app.logger.error(f"Error listing backups: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def run_backup_job():
+    """Write a backup file on a job thread"""
+    with app.app_context():
+        return {'filename': write_backup_file()}
+
 @app.route('/api/backups', methods=['POST'])
 def create_backup_endpoint():
-    """Create a new database backup."""
-    try:
-        app.logger.info("Starting backup creation...")
-        with app.app_context():
-            backup_file = create_backup()
-            app.logger.info(f"Backup created successfully: {backup_file}")
-            return jsonify({
-                'message': 'Backup created successfully',
-                'backup_file': backup_file
-            })
-    except Exception as e:
-        app.logger.error(f"Error creating backup: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    """Start a database backup in the background and return a job id"""
+    app.logger.info("Starting backup creation...")
+    job_id = submit_job(run_backup_job)
+    response = jsonify({'job_id': job_id, 'status': 'pending'})
+    response.headers['Location'] = url_for('get_backup_job', job_id=job_id)
+    return response, 202
+
+@app.route('/api/backups/jobs/<job_id>', methods=['GET'])
+def get_backup_job(job_id):
+    """Poll a background backup job"""
+    return get_job_response(job_id)
 
 @app.route('/api/backup/restore', methods=['POST'])
 def restore_backup_endpoint():
@@ -1110,103 +1541,267 @@ def restore_backup_endpoint():
             db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/status-report', methods=['GET'])
-def generate_status_report():
-    """Generate an AI-powered status report for all projects and tasks"""
-    try:
-        # Get all projects with their tasks
-        projects = Project.query.all()
-        project_data = []
+def build_status_report_data(projects=None):
+    """
+    Collect per-project metrics, tasks and latest status updates for the status report.
+    projects is an optional list of (id, name) rows to limit the report to; by default
+    every project is included. Only the needed columns are read; no ORM objects are built.
+    Projects and tasks are ordered by id so unchanged data yields a byte-identical prompt.
+    """
+    task_filter = []
+    if projects is None:
+        projects = db.session.query(Project.id, Project.name).order_by(Project.id).all()
+    else:
+        task_filter = [Task.project_id.in_([project.id for project in projects])]
+    
+    # Task counts per project and status, aggregated in SQL
+    status_counts = defaultdict(dict)
+    for project_id, status, count in db.session.query(
+        Task.project_id, Task.status, func.count(Task.id)
+    ).filter(*task_filter).group_by(Task.project_id, Task.status):
+        status_counts[project_id][status] = count
+    
+    tasks_by_project = defaultdict(list)
+    for task in db.session.query(
+        Task.id, Task.title, Task.ticket_number, Task.status,
+        Task.priority, Task.current_status, Task.project_id
+    ).filter(*task_filter).order_by(Task.id):
+        tasks_by_project[task.project_id].append(task)
+    
+    # Latest status update per task in one pass over ix_status_update_task_created
+    update_filter = [StatusUpdate.task_id.in_(select(Task.id).where(*task_filter))] if task_filter else []
+    ranked_updates = db.session.query(
+        StatusUpdate.task_id, StatusUpdate.notes, StatusUpdate.created_at,
+        func.row_number().over(
+            partition_by=StatusUpdate.task_id,
+            order_by=(StatusUpdate.created_at.desc(), StatusUpdate.id.desc())
+        ).label('row_number')
+    ).filter(*update_filter).subquery()
+    latest_updates = {
+        update.task_id: update
+        for update in db.session.query(
+            ranked_updates.c.task_id, ranked_updates.c.notes, ranked_updates.c.created_at
+        ).filter(ranked_updates.c.row_number == 1)
+    }
+    
+    project_data = []
+    for project in projects:
+        counts = status_counts[project.id]
+        total_tasks = sum(counts.values())
+        completed_tasks = counts.get('Completed', 0)
         
-        for project in projects:
-            tasks = Task.query.filter_by(project_id=project.id).all()
-            
-            # Calculate project metrics
-            total_tasks = len(tasks)
-            completed_tasks = len([t for t in tasks if t.status == 'Completed'])
-            in_progress_tasks = len([t for t in tasks if t.status == 'In Progress'])
-            not_started_tasks = len([t for t in tasks if t.status == 'Not Started'])
-            on_hold_tasks = len([t for t in tasks if t.status == 'On Hold'])
-            
-            # Get task details including latest status updates
-            task_details = []
-            for task in tasks:
-                latest_update = StatusUpdate.query.filter_by(task_id=task.id).order_by(StatusUpdate.created_at.desc()).first()
-                task_details.append({
-                    'title': task.title,
-                    'ticket_number': task.ticket_number,
-                    'status': task.status,
-                    'priority': task.priority_label,
-                    'latest_update': latest_update.notes if latest_update else None,
-                    'latest_update_time': latest_update.created_at.isoformat() if latest_update else None,
-                    'current_status': task.current_status
-                })
-            
-            project_data.append({
-                'name': project.name,
-                'metrics': {
-                    'total_tasks': total_tasks,
-                    'completed_tasks': completed_tasks,
-                    'in_progress_tasks': in_progress_tasks,
-                    'not_started_tasks': not_started_tasks,
-                    'on_hold_tasks': on_hold_tasks,
-                    'completion_rate': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-                },
-                'tasks': task_details
+        # Get task details including latest status updates
+        task_details = []
+        for task in tasks_by_project[project.id]:
+            latest_update = latest_updates.get(task.id)
+            task_details.append({
+                'title': task.title,
+                'ticket_number': task.ticket_number,
+                'status': task.status,
+                'priority': get_priority_label(task.priority),
+                'latest_update': latest_update.notes if latest_update else None,
+                'latest_update_time': latest_update.created_at.isoformat() if latest_update else None,
+                'current_status': task.current_status
             })
         
-        app.logger.info(f"Collected data for {len(project_data)} projects")
-        
-        if not project_data:
-            return jsonify({
-                'report': "No projects or tasks found to generate a report.",
-                'raw_data': []
-            })
+        project_data.append({
+            'name': project.name,
+            'metrics': {
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
+                'in_progress_tasks': counts.get('In Progress', 0),
+                'not_started_tasks': counts.get('Not Started', 0),
+                'on_hold_tasks': counts.get('On Hold', 0),
+                'completion_rate': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            },
+            'tasks': task_details
+        })
+    return project_data
+
+def build_status_report_prompt(project_data):
+    """Compact status report prompt: each project's metrics plus its most recently updated tasks"""
+    summary = [{
+        'name': project['name'],
+        'metrics': project['metrics'],
+        'recent_tasks': sorted(
+            project['tasks'], key=lambda t: t['latest_update_time'] or '', reverse=True
+        )[:STATUS_REPORT_RECENT_TASKS]
+    } for project in project_data]
+    return STATUS_REPORT_PROMPT % orjson.dumps(summary).decode('utf-8')
+
+def get_status_report_max_tokens(project_count):
+    """Scale the report's output budget with the number of projects it covers"""
+    return min(2000, 400 + 200 * project_count)
+
+def sse_event(data, event=None):
+    """Format one server-sent event with a JSON payload"""
+    prefix = f'event: {event}\n' if event else ''
+    return f"{prefix}data: {orjson.dumps(data).decode('utf-8')}\n\n"
+
+def stream_status_report(project_data, system_prompt, user_prompt, cache_key, cached_report):
+    """
+    Yield the status report as server-sent events: a raw_data event, then the
+    report text as JSON-encoded data chunks, then a done event.
+    """
+    yield sse_event(project_data, event='raw_data')
+    if cached_report is not None:
+        app.logger.info("Using cached AI report")
+        yield sse_event(cached_report)
+        yield sse_event({}, event='done')
+        return
+    
+    try:
+        app.logger.info("Streaming AI report...")
+        response = client.chat.completions.create(
+            model=SCHEDULER_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=SCHEDULER_TEMPERATURE,
+            max_tokens=get_status_report_max_tokens(len(project_data)),
+            stream=True
+        )
+        parts = []
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield sse_event(delta)
         
-        # Generate AI summary using project data
-        system_prompt = """You are an AI project management assistant that creates clear and concise status reports.
-Your goal is to analyze project data and create a well-structured status report that highlights:
-1. Overall project health and progress
-2. Key metrics and completion rates
-3. Important status updates and potential blockers
-4. Recommendations for next steps"""
-
-        user_prompt = f"""Create a detailed status report based on the following project data:
-
-{json.dumps(project_data, indent=2)}
-
-Format the report with these sections:
-1. Executive Summary
-2. Project-by-Project Breakdown
-3. Key Metrics & Progress
-4. Recent Updates & Status Changes
-5. Recommendations
-
-Use markdown formatting for better readability."""
-
+        set_cached_ai_response(cache_key, ''.join(parts).strip())
+        app.logger.info("AI report streamed successfully")
+        yield sse_event({}, event='done')
+    except Exception as e:
+        app.logger.error(f"Error streaming status report: {str(e)}")
+        yield sse_event({'error': str(e)}, event='error')
+
+def get_status_report_cache_key(user_prompt):
+    return get_ai_cache_key(SCHEDULER_MODEL, str(SCHEDULER_TEMPERATURE), STATUS_REPORT_SYSTEM_PROMPT, user_prompt)
+
+def build_status_report(project_data):
+    """Build the status report response body, calling OpenAI only on a cache miss"""
+    if not project_data:
+        return {
+            'report': "No projects or tasks found to generate a report.",
+            'raw_data': []
+        }
+    
+    user_prompt = build_status_report_prompt(project_data)
+    cache_key = get_status_report_cache_key(user_prompt)
+    report_content = get_cached_ai_response(cache_key)
+    
+    if report_content is not None:
+        app.logger.info("Using cached AI report")
+    else:
         app.logger.info("Generating AI report...")
         response = client.chat.completions.create(
-            model="gpt-4",
+            model=SCHEDULER_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": STATUS_REPORT_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.7,
-            max_tokens=2000
+            temperature=SCHEDULER_TEMPERATURE,
+            max_tokens=get_status_report_max_tokens(len(project_data))
         )
         
+        log_prompt_cache_usage(response, 'Status report')
         report_content = response.choices[0].message.content.strip()
+        set_cached_ai_response(cache_key, report_content)
         app.logger.info("AI report generated successfully")
+    
+    return {
+        'report': report_content,
+        'raw_data': project_data
+    }
+
+@app.route('/api/status-report', methods=['GET'])
+def generate_status_report():
+    """Generate an AI-powered status report for all projects and tasks"""
+    try:
+        # The report only changes when the underlying data does. Every response
+        # varies on Accept, since the same URL serves JSON or an event stream.
+        etag = get_table_etag('project', 'task', 'status_update')
+        cached = not_modified(etag)
+        if cached:
+            cached.vary.add('Accept')
+            return cached
         
-        return jsonify({
-            'report': report_content,
-            'raw_data': project_data
-        })
+        project_data = build_status_report_data()
+        
+        app.logger.info(f"Collected data for {len(project_data)} projects")
+        
+        # Stream the report as server-sent events when the client asks for it
+        if project_data and request.accept_mimetypes.best == 'text/event-stream':
+            system_prompt = STATUS_REPORT_SYSTEM_PROMPT
+            user_prompt = build_status_report_prompt(project_data)
+            cache_key = get_status_report_cache_key(user_prompt)
+            response = Response(
+                stream_with_context(stream_status_report(
+                    project_data, system_prompt, user_prompt, cache_key, get_cached_ai_response(cache_key)
+                )),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache'}
+            )
+            response.vary.add('Accept')
+            return response
+        
+        response = with_etag(jsonify(build_status_report(project_data)), etag)
+        response.vary.add('Accept')
+        return response
         
     except Exception as e:
         app.logger.error(f"Error generating status report: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def run_status_report_job():
+    """Build the status report on a job thread"""
+    with app.app_context():
+        return build_status_report(build_status_report_data())
+
+@app.route('/api/status-report/jobs', methods=['POST'])
+def submit_status_report_job():
+    """Start generating the status report in the background and return a job id"""
+    job_id = submit_job(run_status_report_job)
+    response = jsonify({'job_id': job_id, 'status': 'pending'})
+    response.headers['Location'] = url_for('get_status_report_job', job_id=job_id)
+    return response, 202
+
+@app.route('/api/status-report/jobs/<job_id>', methods=['GET'])
+def get_status_report_job(job_id):
+    """Poll a background status report job"""
+    return get_job_response(job_id)
+
+@app.route('/api/status-report/projects', methods=['GET'])
+def stream_status_report_projects():
+    """
+    Stream the status report's per-project data (no AI summary) as NDJSON, one
+    project per line, in pages ordered by project id. Pass the X-Next-Cursor
+    response header back as ?cursor= to fetch the next page.
+    """
+    try:
+        cursor = request.args.get('cursor', 0, type=int)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), 500)
+        
+        projects = db.session.query(Project.id, Project.name).filter(
+            Project.id > cursor
+        ).order_by(Project.id).limit(limit).all()
+        project_data = build_status_report_data(projects)
+        
+        def generate():
+            for project in project_data:
+                yield orjson.dumps(project, option=orjson.OPT_APPEND_NEWLINE)
+        
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        if len(projects) == limit:
+            response.headers['X-Next-Cursor'] = str(projects[-1].id)
+        return response
+    except Exception as e:
+        app.logger.error(f"Error streaming status report projects: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/backup/upload', methods=['POST'])
 def upload_backup():
     """Upload and validate a backup file."""
@@ -1238,8 +1833,7 @@ def upload_backup():
                 return jsonify({'error': 'Unsupported backup version'}), 400
                 
             # Generate a new filename with current timestamp
-            mst = pytz.timezone('America/Denver')
-            timestamp = datetime.now(mst).strftime('%Y%m%d_%H%M%S')
+            timestamp = datetime.now(MST).strftime('%Y%m%d_%H%M%S')
             filename = f'backup_{timestamp}.json'
             
             # Save the file
@@ -1315,8 +1909,21 @@ def create_default_project():
     except Exception as e:
         app.logger.error(f'Error creating default project: {str(e)}')
 
+def init_db():
+    """Create any missing tables and the default project; safe to run on every start"""
+    is_new_database = not inspect(db.engine).get_table_names()
+    db.create_all()
+    if is_new_database:
+        # Tables built from the models are already at the latest revision
+        stamp()
+    create_default_project()  # Create default project after tables are created
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create missing tables and the default project (run before starting gunicorn)"""
+    init_db()
+
 if __name__ == '__main__':
     with app.app_context():
-        db.create_all()
-        create_default_project()  # Create default project after tables are created
+        init_db()
     app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""Add sync_meta table for list endpoint ETags
+
+Revision ID: 3b9e1f2c7a41
+Revises: d67fedf88cde
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9e1f2c7a41'
+down_revision = 'd67fedf88cde'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'sync_meta',
+        sa.Column('table_name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade():
+    op.drop_table('sync_meta')
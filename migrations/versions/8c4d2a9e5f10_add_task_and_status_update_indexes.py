@@ -0,0 +1,26 @@
+"""Add indexes for per-project task and latest status update lookups
+
+Revision ID: 8c4d2a9e5f10
+Revises: 3b9e1f2c7a41
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4d2a9e5f10'
+down_revision = '3b9e1f2c7a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_task_project_status', 'task', ['project_id', 'status'], unique=False)
+    op.create_index('ix_status_update_task_created', 'status_update', ['task_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_status_update_task_created', table_name='status_update')
+    op.drop_index('ix_task_project_status', table_name='task')
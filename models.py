@@ -6,21 +6,57 @@ This module defines the SQLAlchemy models for:
 - Tasks: Individual work items associated with projects
 - Calendar: Events and scheduled tasks
 - Status Updates: Task status updates
+- Sync Meta: Per-table version counters used as ETags by list endpoints
 
 Each model includes priority handling and proper relationship definitions.
 """
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 from datetime import datetime
+import pytz
 
 db = SQLAlchemy()
 
+# Timezone the scheduler works in; calendar times are stored as its wall-clock time
+MST = pytz.timezone('America/Denver')
+
+# Lookup tables shared by the models and the list endpoints in app.py
+PRIORITY_LABELS = {1: 'High', 2: 'Medium', 3: 'Low'}
+TASK_PROGRESS = {'Completed': 100, 'In Progress': 50, 'On Hold': 25}
+
+def get_priority_label(priority):
+    """Convert numeric priority to human-readable label; unknown values read as Medium"""
+    return PRIORITY_LABELS.get(priority, 'Medium')
+
 # Task Dependencies Association Table
 task_dependencies = db.Table('task_dependencies',
     db.Column('task_id', db.Integer, db.ForeignKey('task.id', ondelete='CASCADE'), primary_key=True),
     db.Column('dependency_id', db.Integer, db.ForeignKey('task.id', ondelete='CASCADE'), primary_key=True)
 )
 
+class MSTDateTime(db.TypeDecorator):
+    """
+    DateTime stored as naive MST wall-clock time and loaded as an MST-aware datetime.
+    SQLite keeps no UTC offset, so aware values are converted to MST before saving.
+    """
+    impl = db.DateTime
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(MST).replace(tzinfo=None)
+        return value
+    
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = MST.localize(value)
+        return value
+
 class Project(db.Model):
     """
     Project model representing a high-level work item.
@@ -50,7 +86,7 @@ class Project(db.Model):
     @property
     def priority_label(self):
         """Convert numeric priority to human-readable label"""
-        return {1: 'High', 2: 'Medium', 3: 'Low'}.get(self.priority, 'Medium')
+        return get_priority_label(self.priority)
     
     def to_dict(self):
         """Convert project to dictionary for JSON serialization"""
@@ -67,6 +103,10 @@ class Project(db.Model):
         }
 
 class Task(db.Model):
+    __table_args__ = (
+        db.Index('ix_task_project_status', 'project_id', 'status'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
@@ -96,18 +136,11 @@ class Task(db.Model):
 
     @property
     def priority_label(self):
-        labels = {1: 'High', 2: 'Medium', 3: 'Low'}
-        return labels.get(self.priority, 'Medium')
+        return get_priority_label(self.priority)
 
     @property
     def progress(self):
-        if self.status == 'Completed':
-            return 100
-        elif self.status == 'In Progress':
-            return 50
-        elif self.status == 'On Hold':
-            return 25
-        return 0
+        return TASK_PROGRESS.get(self.status, 0)
 
     def to_dict(self):
         """Convert task to dictionary for JSON serialization"""
@@ -139,6 +172,11 @@ class Task(db.Model):
 
 class StatusUpdate(db.Model):
     """Model for task status updates"""
+    __table_args__ = (
+        # Serves "latest update for a task" lookups and status history
+        db.Index('ix_status_update_task_created', 'task_id', 'created_at'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     task_id = db.Column(db.Integer, db.ForeignKey('task.id'), nullable=False)
     status = db.Column(db.String(50), nullable=False)
@@ -165,8 +203,8 @@ class Calendar(db.Model):
         id (int): Primary key
         title (str): Event title
         description (str): Event description
-        start_time (datetime): Event start time
-        end_time (datetime): Event end time
+        start_time (datetime): Event start time (MST-aware)
+        end_time (datetime): Event end time (MST-aware)
         project_id (int): Optional foreign key to associated project
         task_id (int): Optional foreign key to associated task
         event_type (str): Type of event ('task' or 'meeting' or other types)
@@ -174,8 +212,8 @@ class Calendar(db.Model):
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
-    start_time = db.Column(db.DateTime, nullable=False)
-    end_time = db.Column(db.DateTime, nullable=False)
+    start_time = db.Column(MSTDateTime, nullable=False)
+    end_time = db.Column(MSTDateTime, nullable=False)
     description = db.Column(db.Text)
     project_id = db.Column(db.Integer, db.ForeignKey('project.id'))
     task_id = db.Column(db.Integer, db.ForeignKey('task.id'))
@@ -186,16 +224,91 @@ class Calendar(db.Model):
 
     def to_dict(self):
         """Convert calendar event to dictionary for JSON serialization"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'start': self.start_time.isoformat(),
-            'end': self.end_time.isoformat(),
-            'description': self.description,
-            'project_id': self.project_id,
-            'project_name': self.project.name if self.project else None,
-            'task_id': self.task_id,
-            'event_type': self.event_type,
-            'backgroundColor': self.project.color if self.project else None,
-            'borderColor': self.project.color if self.project else None
-        }
+        project = self.project if self.project_id else None
+        return calendar_event_dict(
+            self,
+            project.name if project else None,
+            project.color if project else None
+        )
+
+def calendar_event_dict(event, project_name, project_color):
+    """
+    Build the calendar feed entry for an event. event is a Calendar or a column
+    query row with the same attribute names; the project fields are passed in so
+    list queries can supply them from a join.
+    """
+    return {
+        'id': event.id,
+        'title': event.title,
+        'start': event.start_time.isoformat(),
+        'end': event.end_time.isoformat(),
+        'description': event.description,
+        'project_id': event.project_id,
+        'project_name': project_name,
+        'task_id': event.task_id,
+        'event_type': event.event_type,
+        'backgroundColor': project_color,
+        'borderColor': project_color
+    }
+
+class SyncMeta(db.Model):
+    """
+    Version counter for a table, bumped whenever rows in that table change.
+    
+    Attributes:
+        table_name (str): Name of the tracked table
+        version (int): Incremented on every flush or bulk statement touching the table
+    """
+    __tablename__ = 'sync_meta'
+    
+    table_name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+def bump_table_versions(connection, table_names):
+    """Increment the SyncMeta version of each table, creating missing rows"""
+    sync_meta = SyncMeta.__table__
+    dialect = connection.dialect.name
+    for table_name in table_names:
+        # A single upsert, so concurrent first writers to a table cannot both insert its row
+        if dialect in ('sqlite', 'postgresql'):
+            insert = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+            connection.execute(
+                insert(sync_meta)
+                .values(table_name=table_name, version=1)
+                .on_conflict_do_update(index_elements=[sync_meta.c.table_name],
+                                       set_={'version': sync_meta.c.version + 1})
+            )
+        elif dialect in ('mysql', 'mariadb'):
+            connection.execute(
+                mysql_insert(sync_meta)
+                .values(table_name=table_name, version=1)
+                .on_duplicate_key_update(version=sync_meta.c.version + 1)
+            )
+        else:
+            result = connection.execute(
+                sync_meta.update()
+                .where(sync_meta.c.table_name == table_name)
+                .values(version=sync_meta.c.version + 1)
+            )
+            if result.rowcount == 0:
+                connection.execute(sync_meta.insert().values(table_name=table_name, version=1))
+
+@event.listens_for(Session, 'after_flush')
+def track_flushed_tables(session, flush_context):
+    """Bump versions for tables with rows added, changed or deleted in this flush"""
+    table_names = {
+        obj.__table__.name
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+        if not isinstance(obj, SyncMeta)
+    }
+    if table_names:
+        bump_table_versions(session.connection(), sorted(table_names))
+
+@event.listens_for(Session, 'do_orm_execute')
+def track_bulk_statements(orm_execute_state):
+    """Bump versions for bulk insert/update/delete statements, which skip the flush"""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is not SyncMeta:
+        bump_table_versions(orm_execute_state.session.connection(), [mapper.local_table.name])
@@ -509,7 +509,9 @@ async function updateTask(taskId, field = null, value = null) {
         const response = await fetch(`/api/tasks/${taskId}`, {
             method: 'PUT',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                // The updated task isn't read from the response; tasks are reloaded below
+                'Prefer': 'return=minimal'
             },
             body: JSON.stringify(taskData)
         });
@@ -1390,31 +1392,30 @@ async function generateStatusReport() {
         showLoading('Generating status report...');
         console.log('Generating status report...'); // Debug log
         
-        const response = await fetch('/api/status-report');
+        // Ask for server-sent events so the report renders as it is generated
+        const response = await fetch('/api/status-report', {
+            headers: { 'Accept': 'text/event-stream' }
+        });
         console.log('Response received:', response.status); // Debug log
         
         if (!response.ok) {
             throw new Error(`Failed to generate status report: ${response.status}`);
         }
         
-        const data = await response.json();
-        console.log('Data received:', data); // Debug log
-        
-        if (data.error) {
-            throw new Error(data.error);
-        }
-        
-        // Convert markdown to HTML using marked
-        const reportHtml = marked.parse(data.report);
-        
-        // Display the report in the modal
         const reportContent = document.getElementById('statusReportContent');
-        reportContent.innerHTML = reportHtml;
         
-        // Show the modal
-        const modal = document.getElementById('statusReportModal');
-        const bootstrapModal = new bootstrap.Modal(modal);
-        bootstrapModal.show();
+        // With no projects the server answers with a plain JSON placeholder instead of a stream
+        if (!(response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+            const data = await response.json();
+            console.log('Data received:', data); // Debug log
+            if (data.error) {
+                throw new Error(data.error);
+            }
+            reportContent.innerHTML = marked.parse(data.report);
+            showStatusReportModal();
+        } else {
+            await readStatusReportStream(response, reportContent);
+        }
         
         showToast('success', 'Status report generated successfully');
     } catch (error) {
@@ -1425,6 +1426,58 @@ async function generateStatusReport() {
     }
 }
 
+function showStatusReportModal() {
+    const modal = document.getElementById('statusReportModal');
+    bootstrap.Modal.getOrCreateInstance(modal).show();
+}
+
+async function readStatusReportStream(response, reportContent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let report = '';
+    let modalShown = false;
+    
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            const payload = data ? JSON.parse(data) : null;
+            
+            if (event === 'error') {
+                throw new Error(payload.error);
+            } else if (event === 'message') {
+                report += payload;
+                reportContent.innerHTML = marked.parse(report);
+                if (!modalShown) {
+                    // Show the modal with the first chunk instead of waiting for the whole report
+                    hideLoading();
+                    showStatusReportModal();
+                    modalShown = true;
+                }
+            }
+        }
+    }
+    
+    if (!modalShown) {
+        reportContent.innerHTML = marked.parse(report);
+        showStatusReportModal();
+    }
+}
+
 async function copyStatusReport() {
     try {
         const reportContent = document.getElementById('statusReportContent');
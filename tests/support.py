@@ -0,0 +1,25 @@
+"""Shared setup for the tests: the app reads its database URI and OpenAI key at import time"""
+import atexit
+import os
+import tempfile
+
+_db_file = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+_db_file.close()
+os.environ['DATABASE_URL'] = 'sqlite:///' + _db_file.name
+os.environ.setdefault('OPENAI_API_KEY', 'test-key')
+
+import app as app_module  # noqa: E402
+from app import app, db  # noqa: E402
+
+with app.app_context():
+    db.create_all()
+
+
+@atexit.register
+def _remove_db_file():
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(_db_file.name + suffix):
+            os.unlink(_db_file.name + suffix)
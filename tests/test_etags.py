@@ -0,0 +1,49 @@
+import gzip
+import json
+import unittest
+
+from support import app
+
+
+class CompressedETagTest(unittest.TestCase):
+    """Revalidating a gzip-compressed list response must still return 304"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = app.test_client()
+        project = cls.client.post('/api/projects', json={'name': 'ETag project'}).get_json()
+        # Enough tasks to push /api/tasks past Flask-Compress's minimum size
+        for i in range(10):
+            cls.client.post('/api/tasks', json={
+                'title': f'Task {i}',
+                'description': 'A description long enough to make the response worth compressing',
+                'project_id': project['id']
+            })
+
+    def test_compressed_etag_revalidates(self):
+        response = self.client.get('/api/tasks', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        etag = response.headers['ETag']
+        self.assertTrue(etag.endswith(':gzip"'), etag)
+
+        revalidated = self.client.get('/api/tasks', headers={
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': etag
+        })
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_changed_data_does_not_revalidate(self):
+        response = self.client.get('/api/tasks', headers={'Accept-Encoding': 'gzip'})
+        etag = response.headers['ETag']
+        project_id = json.loads(gzip.decompress(response.data))['tasks'][0]['project_id']
+        self.client.post('/api/tasks', json={'title': 'New task', 'project_id': project_id})
+
+        revalidated = self.client.get('/api/tasks', headers={
+            'Accept-Encoding': 'gzip',
+            'If-None-Match': etag
+        })
+        self.assertEqual(revalidated.status_code, 200)
+
+if __name__ == '__main__':
+    unittest.main()
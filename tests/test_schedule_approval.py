@@ -0,0 +1,45 @@
+import unittest
+
+from support import app, db
+from models import Calendar
+
+
+class BatchApprovalTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = app.test_client()
+        project = cls.client.post('/api/projects', json={'name': 'Batch project'}).get_json()
+        cls.task_ids = [
+            cls.client.post('/api/tasks', json={'title': f'Batch task {i}', 'project_id': project['id']}).get_json()['id']
+            for i in range(5)
+        ]
+
+    def test_event_ids_follow_suggestion_order(self):
+        # Deliberately not in task id order
+        order = [self.task_ids[i] for i in (3, 0, 4, 1, 2)]
+        suggestions = [
+            {'task_id': task_id, 'suggested_time': f'2030-02-04T{9 + index:02d}:00:00-07:00', 'duration': 30}
+            for index, task_id in enumerate(order)
+        ]
+        response = self.client.post('/api/schedule/approve_batch', json={'suggestions': suggestions})
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        event_ids = response.get_json()['event_ids']
+        self.assertEqual(len(event_ids), len(suggestions))
+
+        with app.app_context():
+            for event_id, suggestion in zip(event_ids, suggestions):
+                event = db.session.get(Calendar, event_id)
+                self.assertEqual(event.task_id, suggestion['task_id'])
+                self.assertEqual(event.start_time.isoformat(), suggestion['suggested_time'])
+
+    def test_malformed_item_is_rejected_with_field_name(self):
+        response = self.client.post('/api/schedule/approve_batch', json=[
+            {'task_id': self.task_ids[0], 'suggested_time': '2030-02-04T09:00:00', 'duration': 'soon'}
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('duration', response.get_json()['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
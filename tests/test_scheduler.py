@@ -0,0 +1,68 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from support import app_module
+
+MST = app_module.MST
+
+
+def mst(*args):
+    return MST.localize(datetime(*args))
+
+
+def task(task_id, minutes):
+    return SimpleNamespace(id=task_id, title=f'Task {task_id}', estimated_minutes=minutes)
+
+
+def event(start, end):
+    return SimpleNamespace(start_time=start, end_time=end)
+
+
+def suggest(tasks, events, now):
+    with app_module.app.app_context():
+        return app_module.generate_schedule_suggestions(tasks, events, now)
+
+
+class ScheduleSuggestionTest(unittest.TestCase):
+
+    def test_busy_block_ending_overnight_friday_skips_the_weekend(self):
+        # Back-to-back events from Friday 3:30 PM until 1 AM Saturday
+        events = [
+            event(mst(2025, 3, 7, 15, 30), mst(2025, 3, 7, 17, 0)),
+            event(mst(2025, 3, 7, 17, 0), mst(2025, 3, 7, 20, 0)),
+            event(mst(2025, 3, 7, 20, 0), mst(2025, 3, 8, 1, 0)),
+        ]
+        [(_, suggested_time)] = suggest([task(1, 240)], events, mst(2025, 3, 7, 12, 0))
+        # Monday 7 AM, after the DST change on Sunday
+        self.assertEqual(suggested_time, mst(2025, 3, 10, 7, 0))
+        self.assertEqual(suggested_time.utcoffset(), timedelta(hours=-6))
+
+    def test_weekend_start_moves_to_monday(self):
+        [(_, suggested_time)] = suggest([task(1, 30)], [], mst(2025, 3, 15, 10, 0))
+        self.assertEqual(suggested_time, mst(2025, 3, 17, 7, 0))
+
+    def test_suggestions_stay_in_working_hours_and_avoid_events(self):
+        rng = random.Random(1234)
+        for _ in range(300):
+            now = mst(2025, 3, 3, 0, 0) + timedelta(minutes=rng.randrange(0, 14 * 24 * 60, 15))
+            events = []
+            for _ in range(rng.randrange(0, 12)):
+                start = now + timedelta(minutes=rng.randrange(0, 5 * 24 * 60, 15))
+                events.append(event(start, start + timedelta(minutes=rng.randrange(15, 12 * 60, 15))))
+            tasks = [task(i, rng.choice([None, 15, 30, 60, 120, 240])) for i in range(rng.randrange(1, 6))]
+
+            for scheduled_task, suggested_time in suggest(tasks, events, now):
+                local = suggested_time.astimezone(MST)
+                self.assertLess(local.weekday(), 5, local)
+                self.assertTrue(7 <= local.hour < 17, local)
+                self.assertGreaterEqual(suggested_time, now)
+                end = suggested_time + timedelta(minutes=scheduled_task.estimated_minutes or 30)
+                for busy in events:
+                    self.assertFalse(suggested_time < busy.end_time and end > busy.start_time,
+                                     (local, busy.start_time, busy.end_time))
+
+
+if __name__ == '__main__':
+    unittest.main()
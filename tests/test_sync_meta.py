@@ -0,0 +1,63 @@
+import unittest
+
+from sqlalchemy import delete, insert, update
+
+from support import app, db
+from models import Project, SyncMeta, Task, bump_table_versions
+
+
+def version(table_name):
+    return db.session.get(SyncMeta, table_name, populate_existing=True).version
+
+
+class SyncMetaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.context = app.app_context()
+        self.context.push()
+        project = Project(name='Sync project')
+        db.session.add(project)
+        db.session.commit()
+        self.project_id = project.id
+
+    def tearDown(self):
+        db.session.rollback()
+        self.context.pop()
+
+    def test_flush_bumps_changed_tables(self):
+        before = version('project')
+        db.session.add(Project(name='Another sync project'))
+        db.session.commit()
+        self.assertEqual(version('project'), before + 1)
+
+        project = db.session.get(Project, self.project_id)
+        project.name = 'Renamed sync project'
+        db.session.commit()
+        self.assertEqual(version('project'), before + 2)
+
+    def test_bulk_statements_bump_their_table(self):
+        db.session.add(Task(title='Flushed task', project_id=self.project_id))
+        db.session.commit()
+        before = version('task')
+
+        db.session.execute(insert(Task).values(title='Bulk task', project_id=self.project_id))
+        db.session.commit()
+        self.assertEqual(version('task'), before + 1)
+
+        db.session.execute(update(Task).where(Task.project_id == self.project_id).values(status='On Hold'))
+        db.session.commit()
+        self.assertEqual(version('task'), before + 2)
+
+        db.session.execute(delete(Task).where(Task.title == 'Bulk task'))
+        db.session.commit()
+        self.assertEqual(version('task'), before + 3)
+
+    def test_first_bump_creates_the_row(self):
+        with db.engine.begin() as connection:
+            bump_table_versions(connection, ['new_table'])
+            bump_table_versions(connection, ['new_table'])
+        self.assertEqual(version('new_table'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()